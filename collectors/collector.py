@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import asyncio
+from collections import defaultdict
+from urllib.parse import urlparse
 
 from collectors.planner import FetchTask
 from collectors.http_client import HttpClient
 from core.context import RunContext
-from core.ids import normalize_url, content_hash
-from evidence.snapshot import RawSnapshot, SnapshotStore
+from core.ids import utcnow
+from evidence.snapshot import RawSnapshot, SnapshotStore, new_snapshot_id
 
 
 async def _collect_task(
@@ -16,33 +18,65 @@ async def _collect_task(
     client: HttpClient,
     store: SnapshotStore,
     run_id: str,
+    store_headers: bool = True,
 ) -> tuple[RawSnapshot | None, str | None]:
     """Collect a single task and store snapshot.
 
+    The response body is streamed straight into the store rather than
+    buffered in memory. Store I/O runs in worker threads so disk writes
+    overlap with other fetches instead of blocking the event loop.
+    Response headers are only kept on the snapshot if ``store_headers``
+    is set.
+
     Returns:
         Tuple of (snapshot, error_message)
     """
-    result = await client.fetch(task.url)
+    snapshot_id = new_snapshot_id()
+    writer = await asyncio.to_thread(store.open_content, run_id, snapshot_id)
+
+    async def sink(chunk: bytes) -> None:
+        await asyncio.to_thread(writer.write, chunk)
+
+    async def restart() -> None:
+        await asyncio.to_thread(writer.reset)
+
+    try:
+        result = await client.fetch(task.url, sink=sink, restart=restart)
+    except BaseException:
+        writer.abort()
+        raise
+
+    content_path: str | None = None
+    compression: str | None = None
+    if result.error is None:
+        content_path = await asyncio.to_thread(writer.commit)
+        compression = writer.compression
+    else:
+        # The body never arrived in full; don't keep a partial one
+        await asyncio.to_thread(writer.abort)
 
     snapshot = RawSnapshot(
+        snapshot_id=snapshot_id,
         run_id=run_id,
         source_id=task.source_id,
         source_type=task.source_type,
         original_url=task.original_url,
-        canonical_url=normalize_url(task.url),
-        fetched_at=datetime.now(timezone.utc),
+        canonical_url=task.canonical_url,
+        fetched_at=utcnow(),
         status_code=result.status_code,
         success=result.success,
-        content_hash=content_hash(result.content) if result.content else None,
+        content_hash=result.content_hash,
         content_type=result.content_type,
-        content_length=len(result.content),
+        content_length=result.content_length,
         duration_ms=result.duration_ms,
         error=result.error,
-        headers=result.headers,
+        headers=dict(result.headers) if store_headers else {},
+        content_path=content_path,
+        content_compression=compression,
     )
 
-    # Store the snapshot (metadata + content)
-    stored = store.save(snapshot, result.content)
+    # Store the snapshot metadata
+    stored = await asyncio.to_thread(store.save_metadata, snapshot)
 
     if not result.success:
         return stored, result.error or f"HTTP {result.status_code}"
@@ -57,7 +91,8 @@ async def collect(
 ) -> list[RawSnapshot]:
     """Collect all fetch tasks and store raw snapshots.
 
-    This stage only fetches and stores - it does not parse.
+    This stage only fetches and stores - it does not parse. Fetches go
+    through the run's shared HTTP client (see RunContext.get_http).
 
     Args:
         tasks: List of fetch tasks from planning stage
@@ -72,25 +107,57 @@ async def collect(
     snapshots: list[RawSnapshot] = []
     errors: list[str] = []
 
-    # Group tasks by rate limit to avoid overwhelming any single source
-    async with HttpClient(
-        timeout=ctx.settings.default_timeout,
-        rate_limit=ctx.settings.default_rate_limit,
-    ) as client:
-        for task in tasks:
-            snapshot, error = await _collect_task(
-                task, client, store, ctx.run_id
+    # Cap total in-flight fetches, and per-host fetches so one slow source
+    # can't starve the others
+    sem = asyncio.Semaphore(ctx.settings.max_concurrent_fetches)
+    host_sems: dict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(ctx.settings.max_fetches_per_host)
+    )
+
+    client = await ctx.get_http()
+
+    async def _bounded(
+        task: FetchTask,
+    ) -> tuple[RawSnapshot | None, str | None]:
+        # Wait for the host first, so tasks queued behind a busy host
+        # don't hold global slots other hosts could use
+        async with host_sems[urlparse(task.url).netloc], sem:
+            return await _collect_task(
+                task,
+                client,
+                store,
+                ctx.run_id,
+                store_headers=ctx.settings.store_response_headers,
             )
 
-            if snapshot:
-                snapshots.append(snapshot)
-                if snapshot.success:
-                    ctx.metrics.num_snapshots_success += 1
-                else:
-                    ctx.metrics.num_snapshots_failed += 1
+    try:
+        results = await asyncio.gather(
+            *[_bounded(task) for task in tasks], return_exceptions=True
+        )
+    finally:
+        await asyncio.to_thread(store.flush)
+
+    num_success = num_failed = 0
+
+    for task, result in zip(tasks, results, strict=True):
+        if isinstance(result, BaseException):
+            errors.append(f"{task.source_id}: {result}")
+            continue
+
+        snapshot, error = result
+
+        if snapshot:
+            snapshots.append(snapshot)
+            if snapshot.success:
+                num_success += 1
+            else:
+                num_failed += 1
+
+        if error:
+            errors.append(f"{task.source_id}: {error}")
 
-            if error:
-                errors.append(f"{task.source_id}: {error}")
+    ctx.metrics.num_snapshots_success += num_success
+    ctx.metrics.num_snapshots_failed += num_failed
 
     ctx.complete_stage(
         "collect",
@@ -4,17 +4,30 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass, field
 from typing import Any
+from urllib.parse import urlparse
 
 import httpx
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
+
+from core.ids import content_hasher
+
+# Connection pool sizing. Keep-alive connections let repeat fetches to the
+# same host skip the TCP + TLS handshake.
+POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0,
 )
 
+# Read size when streaming response bodies
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Errors worth retrying, and the cap on exponential backoff between attempts
+RETRYABLE_ERRORS = (httpx.TimeoutException, httpx.NetworkError)
+MAX_RETRY_WAIT = 10.0
+
 
 @dataclass
 class FetchResult:
@@ -23,34 +36,50 @@ class FetchResult:
     url: str
     status_code: int
     content: bytes
-    headers: dict[str, str]
+    headers: Mapping[str, str]  # response headers as-is, not copied
     content_type: str | None
     duration_ms: float
     success: bool
     error: str | None = None
     retry_count: int = 0
+    content_hash: str | None = None
+    content_length: int = 0
 
 
 @dataclass
 class RateLimiter:
-    """Simple rate limiter using token bucket."""
+    """Token bucket rate limiter, one bucket per host.
+
+    Each host's bucket holds up to ``capacity`` tokens and refills at
+    ``rate`` tokens per second, so independent hosts don't throttle
+    each other.
+    """
 
-    rate: float  # requests per second
-    _last_request: float = field(default=0.0, init=False)
+    rate: float  # requests per second, per host
+    capacity: float = 1.0
+    _tokens: dict[str, float] = field(default_factory=dict, init=False)
+    _last_refill: dict[str, float] = field(default_factory=dict, init=False)
 
-    async def acquire(self) -> None:
-        """Wait if needed to respect rate limit."""
+    async def acquire(self, host: str = "") -> None:
+        """Wait if needed to respect the rate limit for ``host``."""
         if self.rate <= 0:
             return
 
-        min_interval = 1.0 / self.rate
         now = time.monotonic()
-        elapsed = now - self._last_request
+        elapsed = now - self._last_refill.get(host, now)
+        tokens = min(
+            self.capacity,
+            self._tokens.get(host, self.capacity) + elapsed * self.rate,
+        )
 
-        if elapsed < min_interval:
-            await asyncio.sleep(min_interval - elapsed)
+        # Take the token before sleeping so concurrent callers queue up
+        # behind each other instead of all waking at once
+        tokens -= 1
+        self._tokens[host] = tokens
+        self._last_refill[host] = now
 
-        self._last_request = time.monotonic()
+        if tokens < 0:
+            await asyncio.sleep(-tokens / self.rate)
 
 
 class HttpClient:
@@ -75,61 +104,119 @@ class HttpClient:
             timeout=httpx.Timeout(self.timeout),
             headers={"User-Agent": self.user_agent},
             follow_redirects=True,
+            http2=True,
+            limits=POOL_LIMITS,
         )
         return self
 
     async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
         if self._client:
             await self._client.aclose()
             self._client = None
 
-    async def fetch(self, url: str) -> FetchResult:
-        """Fetch a URL with rate limiting and retries."""
-        await self.rate_limiter.acquire()
+    async def fetch(
+        self,
+        url: str,
+        sink: Callable[[bytes], Awaitable[None]] | None = None,
+        restart: Callable[[], Awaitable[None]] | None = None,
+    ) -> FetchResult:
+        """Fetch a URL with rate limiting and retries.
+
+        The body is hashed as it streams in. If ``sink`` is given, each
+        chunk is passed to it and ``FetchResult.content`` is left empty;
+        otherwise the body is buffered into ``content``.
+
+        Timeouts and network errors are retried with exponential backoff
+        (1s, doubling, capped at MAX_RETRY_WAIT), including ones raised
+        while reading the body. ``restart`` is awaited before each retry
+        so the sink can discard the partial body it was given. A failed
+        fetch reports no content, hash or length.
+        """
+        await self.rate_limiter.acquire(urlparse(url).netloc)
 
         start_time = time.monotonic()
-        retry_count = 0
-
-        try:
-            result = await self._fetch_with_retry(url)
-            duration_ms = (time.monotonic() - start_time) * 1000
-
-            return FetchResult(
-                url=url,
-                status_code=result.status_code,
-                content=result.content,
-                headers=dict(result.headers),
-                content_type=result.headers.get("content-type"),
-                duration_ms=duration_ms,
-                success=result.is_success,
-                retry_count=retry_count,
-            )
-
-        except Exception as e:
-            duration_ms = (time.monotonic() - start_time) * 1000
-            return FetchResult(
-                url=url,
-                status_code=0,
-                content=b"",
-                headers={},
-                content_type=None,
-                duration_ms=duration_ms,
-                success=False,
-                error=str(e),
-                retry_count=retry_count,
-            )
-
-    async def _fetch_with_retry(self, url: str) -> httpx.Response:
-        """Internal fetch with retry logic."""
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use 'async with' context.")
-
-        @retry(
-            stop=stop_after_attempt(self.max_retries),
-            wait=wait_exponential(multiplier=1, min=1, max=10),
-            retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
+        delay = 1.0
+        attempt = 0
+
+        while True:
+            response: httpx.Response | None = None
+            hasher = content_hasher()
+            chunks: list[bytes] = []
+            size = 0
+
+            try:
+                if not self._client:
+                    raise RuntimeError(
+                        "Client not initialized. Use 'async with' context."
+                    )
+                if attempt and restart is not None:
+                    await restart()
+
+                request = self._client.build_request("GET", url)
+                response = await self._client.send(request, stream=True)
+                try:
+                    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                        hasher.update(chunk)
+                        size += len(chunk)
+                        if sink is None:
+                            chunks.append(chunk)
+                        else:
+                            await sink(chunk)
+                finally:
+                    await response.aclose()
+                break
+
+            except RETRYABLE_ERRORS as e:
+                attempt += 1
+                if attempt >= self.max_retries:
+                    return self._failed(url, start_time, e, response, attempt - 1)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_WAIT)
+
+            except Exception as e:
+                return self._failed(url, start_time, e, response, attempt)
+
+        duration_ms = (time.monotonic() - start_time) * 1000
+
+        return FetchResult(
+            url=url,
+            status_code=response.status_code,
+            content=b"".join(chunks),
+            headers=response.headers,
+            content_type=response.headers.get("content-type"),
+            duration_ms=duration_ms,
+            success=response.is_success,
+            retry_count=attempt,
+            content_hash=hasher.hexdigest() if size else None,
+            content_length=size,
         )
-        async def _do_fetch() -> httpx.Response:
-            return await self._client.get(url)  # type: ignore
 
-        return await _do_fetch()
+    @staticmethod
+    def _failed(
+        url: str,
+        start_time: float,
+        error: Exception,
+        response: httpx.Response | None,
+        retry_count: int,
+    ) -> FetchResult:
+        """Build the result of a fetch that never got a complete body.
+
+        If the headers arrived before the failure, their status code and
+        headers are kept.
+        """
+        headers: Mapping[str, str] = response.headers if response else {}
+        return FetchResult(
+            url=url,
+            status_code=response.status_code if response else 0,
+            content=b"",
+            headers=headers,
+            content_type=headers.get("content-type"),
+            duration_ms=(time.monotonic() - start_time) * 1000,
+            success=False,
+            error=str(error) or type(error).__name__,
+            retry_count=retry_count,
+        )
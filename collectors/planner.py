@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
 
 from core.context import RunContext
 from core.config import SourceConfig
+from core.ids import normalize_url
 
 
-class FetchPolicy(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FetchPolicy:
     """Policy for how to fetch a source."""
 
     rate_limit_rps: float = 1.0
@@ -17,7 +21,24 @@ class FetchPolicy(BaseModel):
     follow_links: bool = False
 
 
-class FetchTask(BaseModel):
+@lru_cache(maxsize=256)
+def _make_policy(
+    rate_limit_rps: float,
+    timeout_seconds: int,
+    max_retries: int,
+    follow_links: bool,
+) -> FetchPolicy:
+    """Get a shared FetchPolicy - most sources use identical settings."""
+    return FetchPolicy(
+        rate_limit_rps=rate_limit_rps,
+        timeout_seconds=timeout_seconds,
+        max_retries=max_retries,
+        follow_links=follow_links,
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class FetchTask:
     """A single fetch task for the collector."""
 
     url: str
@@ -25,7 +46,8 @@ class FetchTask(BaseModel):
     source_type: str
     fetch_policy: FetchPolicy
     original_url: str  # Keep original before normalization
-    metadata: dict = Field(default_factory=dict)
+    canonical_url: str  # Normalized once at planning time
+    metadata: dict[str, Any] = field(default_factory=dict)
 
     @classmethod
     def from_source_config(cls, config: SourceConfig) -> FetchTask:
@@ -33,13 +55,14 @@ class FetchTask(BaseModel):
         return cls(
             url=config.url,
             original_url=config.url,
+            canonical_url=normalize_url(config.url),
             source_id=config.source_id,
             source_type=config.source_type,
-            fetch_policy=FetchPolicy(
-                rate_limit_rps=config.rate_limit_rps,
-                timeout_seconds=config.timeout_seconds,
-                max_retries=config.max_retries,
-                follow_links=config.follow_links,
+            fetch_policy=_make_policy(
+                config.rate_limit_rps,
+                config.timeout_seconds,
+                config.max_retries,
+                config.follow_links,
             ),
             metadata=config.metadata,
         )
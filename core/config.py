@@ -9,6 +9,13 @@ import yaml
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Prefer the libyaml-backed C loader; fall back to the pure-Python one if
+# PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
 
 class SourceConfig(BaseModel):
     """Configuration for a single source."""
@@ -44,6 +51,7 @@ class Settings(BaseSettings):
 
     # Storage
     snapshots_dir: str = "./data/snapshots"
+    compress_snapshots: bool = True
     config_snapshots_dir: str = "./data/config_snapshots"
 
     # Runtime
@@ -52,16 +60,21 @@ class Settings(BaseSettings):
 
     # HTTP client defaults
     default_timeout: int = 30
-    default_rate_limit: float = 1.0
+    default_rate_limit: float = 1.0  # requests per second, per host
+    max_concurrent_fetches: int = Field(default=16, ge=1)
+    max_fetches_per_host: int = Field(default=4, ge=1)
+    store_response_headers: bool = True
 
 
 def load_sources_config(path: Path) -> SourcesConfig:
     """Load sources configuration from YAML file."""
-    if not path.exists():
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
         return SourcesConfig()
 
-    with open(path) as f:
-        data = yaml.safe_load(f) or {}
+    # One read; libyaml decodes the bytes itself
+    data = yaml.load(raw, Loader=YamlLoader) or {}
 
     return SourcesConfig(**data)
 
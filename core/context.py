@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
-import json
-from datetime import datetime, timezone
+import os
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field, fields
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, PrivateAttr
 
 from core.config import Settings, SourcesConfig, snapshot_config
-from core.ids import generate_run_id
+from core.ids import generate_run_id, utcnow
+
+if TYPE_CHECKING:
+    from collectors.http_client import HttpClient
 
 
 class RunStatus(str, Enum):
@@ -23,7 +30,8 @@ class RunStatus(str, Enum):
     FAILED = "failed"
 
 
-class RunMetrics(BaseModel):
+@dataclass(slots=True)
+class RunMetrics:
     """Metrics collected during a run."""
 
     num_fetch_tasks: int = 0
@@ -35,7 +43,12 @@ class RunMetrics(BaseModel):
     num_candidates: int = 0
 
 
-class StageLog(BaseModel):
+# Read directly in summary(); asdict() deep-copies every value
+_METRIC_FIELDS = tuple(f.name for f in fields(RunMetrics))
+
+
+@dataclass(slots=True)
+class StageLog:
     """Log entry for a pipeline stage."""
 
     stage: str
@@ -44,7 +57,7 @@ class StageLog(BaseModel):
     status: str = "running"
     items_in: int = 0
     items_out: int = 0
-    errors: list[str] = Field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
     duration_seconds: float | None = None
 
 
@@ -67,6 +80,15 @@ class RunContext(BaseModel):
     # Paths
     config_snapshot_path: Path | None = None
 
+    # Run-scoped resources, released by aclose()
+    _http: HttpClient | None = PrivateAttr(default=None)
+    # Open stage logs by name, oldest first, so complete_stage doesn't
+    # scan stage_logs
+    _open_stages: dict[str, deque[StageLog]] = PrivateAttr(default_factory=dict)
+    _cleanups: list[Callable[[], Awaitable[None]]] = PrivateAttr(
+        default_factory=list
+    )
+
     class Config:
         arbitrary_types_allowed = True
 
@@ -82,7 +104,7 @@ class RunContext(BaseModel):
         Creates the run, saves config snapshot, and returns initialized context.
         """
         run_id = run_id or generate_run_id()
-        started_at = datetime.now(timezone.utc)
+        started_at = utcnow()
 
         # Create config snapshot directory
         snapshot_dir = Path(settings.config_snapshots_dir)
@@ -94,8 +116,11 @@ class RunContext(BaseModel):
         config_data["run_id"] = run_id
         config_data["started_at"] = started_at.isoformat()
 
-        with open(snapshot_path, "w") as f:
-            json.dump(config_data, f, indent=2, default=str)
+        # Write to a temp file and rename it into place, so a crash never
+        # leaves a truncated config snapshot behind
+        tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.tmp")
+        tmp_path.write_bytes(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, snapshot_path)
 
         return cls(
             run_id=run_id,
@@ -106,14 +131,58 @@ class RunContext(BaseModel):
             config_snapshot_path=snapshot_path,
         )
 
+    async def get_http(self) -> HttpClient:
+        """Get the run's shared HTTP client, opening it on first use.
+
+        One client spans every stage of the run, so its connection pool
+        and TLS sessions are reused across stages. It is closed by aclose().
+        """
+        if self._http is None:
+            from collectors.http_client import HttpClient
+
+            client = HttpClient(
+                timeout=self.settings.default_timeout,
+                rate_limit=self.settings.default_rate_limit,
+            )
+            await client.__aenter__()
+            self.add_cleanup(client.aclose)
+            self._http = client
+
+        return self._http
+
+    def add_cleanup(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Register an async callback to run when the run is closed."""
+        self._cleanups.append(callback)
+
+    async def aclose(self) -> None:
+        """Release run-scoped resources, most recently registered first.
+
+        Every callback runs even if an earlier one raises; the first error
+        is re-raised once all of them have run.
+        """
+        errors: list[Exception] = []
+        try:
+            while self._cleanups:
+                callback = self._cleanups.pop()
+                try:
+                    await callback()
+                except Exception as e:
+                    errors.append(e)
+        finally:
+            self._http = None
+
+        if errors:
+            raise errors[0]
+
     def start_stage(self, stage: str, items_in: int = 0) -> StageLog:
         """Record start of a stage."""
         log = StageLog(
             stage=stage,
-            started_at=datetime.now(timezone.utc),
+            started_at=utcnow(),
             items_in=items_in,
         )
         self.stage_logs.append(log)
+        self._open_stages.setdefault(stage, deque()).append(log)
         return log
 
     def complete_stage(
@@ -123,32 +192,51 @@ class RunContext(BaseModel):
         errors: list[str] | None = None,
         status: str = "completed",
     ) -> None:
-        """Record completion of a stage."""
-        for log in self.stage_logs:
-            if log.stage == stage and log.completed_at is None:
-                log.completed_at = datetime.now(timezone.utc)
-                log.items_out = items_out
-                log.status = status
-                if errors:
-                    log.errors = errors
-                log.duration_seconds = (
-                    log.completed_at - log.started_at
-                ).total_seconds()
-                break
+        """Record completion of a stage.
+
+        Completes the oldest open log for the stage.
+        """
+        log: StageLog | None
+        open_logs = self._open_stages.get(stage)
+        if open_logs:
+            log = open_logs.popleft()
+            if not open_logs:
+                del self._open_stages[stage]
+        else:
+            # Logs appended to stage_logs without start_stage()
+            log = next(
+                (
+                    log
+                    for log in self.stage_logs
+                    if log.stage == stage and log.completed_at is None
+                ),
+                None,
+            )
+            if log is None:
+                return
+
+        log.completed_at = utcnow()
+        log.items_out = items_out
+        log.status = status
+        if errors:
+            log.errors = errors
+        log.duration_seconds = (log.completed_at - log.started_at).total_seconds()
 
     def complete_run(self, status: RunStatus = RunStatus.COMPLETED) -> None:
         """Mark the run as complete."""
         self.status = status
-        self.completed_at = datetime.now(timezone.utc)
+        self.completed_at = utcnow()
 
     def summary(self) -> dict[str, Any]:
         """Get a summary of the run for display."""
+        metrics = self.metrics
+        completed_at = self.completed_at
         return {
             "run_id": self.run_id,
             "status": self.status.value,
             "started_at": self.started_at.isoformat(),
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "metrics": self.metrics.model_dump(),
+            "completed_at": completed_at.isoformat() if completed_at else None,
+            "metrics": {name: getattr(metrics, name) for name in _METRIC_FIELDS},
             "stages": [
                 {
                     "stage": log.stage,
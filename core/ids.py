@@ -4,33 +4,50 @@ from __future__ import annotations
 
 import hashlib
 import re
-from datetime import datetime, timezone
-from urllib.parse import parse_qs, urlparse, urlunparse
-import uuid
+import secrets
+from datetime import UTC, datetime
+from functools import lru_cache, partial
+from urllib.parse import unquote_plus, urlparse, urlunparse, uses_params
+
+# Current UTC time. A partial of datetime.now, so calls skip the
+# datetime.now / UTC lookups.
+utcnow = partial(datetime.now, UTC)
 
 
 def generate_run_id() -> str:
     """Generate a unique run ID.
 
-    Format: YYYYMMDD_HHMMSS_<short_uuid>
+    Format: YYYYMMDD_HHMMSS_<8 hex chars>
+    """
+    now = utcnow()
+    suffix = secrets.token_hex(4)
+    return f"{now.strftime('%Y%m%d_%H%M%S')}_{suffix}"
+
+
+def content_hasher() -> hashlib.blake2b:
+    """Create an incremental hasher for streamed content.
+
+    Feed it with ``update()``; its ``hexdigest()`` is the same value
+    ``content_hash`` returns for the full content.
     """
-    now = datetime.now(timezone.utc)
-    short_uuid = uuid.uuid4().hex[:8]
-    return f"{now.strftime('%Y%m%d_%H%M%S')}_{short_uuid}"
+    return hashlib.blake2b(digest_size=8)
 
 
 def content_hash(content: str | bytes) -> str:
-    """Generate SHA-256 hash of content.
+    """Generate a BLAKE2b hash of content.
 
-    Returns first 16 characters for brevity while maintaining uniqueness.
+    Returns a 16-character hex digest - short, but ample for dedup. This
+    is not a security hash.
     """
     if isinstance(content, str):
         content = content.encode("utf-8")
-    return hashlib.sha256(content).hexdigest()[:16]
+    hasher = content_hasher()
+    hasher.update(content)
+    return hasher.hexdigest()
 
 
 # URL parameters to strip during normalization (tracking params)
-TRACKING_PARAMS = {
+TRACKING_PARAMS = frozenset({
     "utm_source",
     "utm_medium",
     "utm_campaign",
@@ -42,9 +59,68 @@ TRACKING_PARAMS = {
     "source",
     "mc_cid",
     "mc_eid",
-}
+})
+
+# scheme://host/path?query#fragment with no whitespace, control characters
+# or IPv6 brackets in it - the shape of every URL we plan and collect.
+# Anything else is split by urllib.parse.
+_URL_RE = re.compile(
+    r"([A-Za-z][A-Za-z0-9+.-]*)://([^/?#\[\]\x00-\x20]+)"
+    r"(/[^?#\x00-\x20]*|)(?:\?([^#\x00-\x20]*))?(?:#[^\x00-\x20]*)?"
+)
+
+
+def _split_url(url: str) -> tuple[str, str, str, str]:
+    """Split a URL into (scheme, netloc, path, query) as urlparse would.
+
+    Params and fragment are dropped. The scheme is lowercased.
+    """
+    match = _URL_RE.fullmatch(url)
+    if match is None or not match.group(2).isascii():
+        parsed = urlparse(url)
+        return parsed.scheme, parsed.netloc, parsed.path, parsed.query
+
+    scheme, netloc, path, query = match.groups()
+    scheme = scheme.lower()
 
+    # Strip ;params from the last path segment, like urlparse
+    if ";" in path and scheme in uses_params:
+        semi = path.find(";", path.rfind("/"))
+        if semi >= 0:
+            path = path[:semi]
 
+    return scheme, netloc, path, query or ""
+
+
+def _filter_query(query: str) -> str:
+    """Drop tracking params and sort the rest, keeping each key's first value.
+
+    Keys and values are decoded like parse_qs(keep_blank_values=True).
+    """
+    pairs: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    for pair in query.split("&"):
+        if not pair:
+            continue
+        key, _, value = pair.partition("=")
+        if "%" in key or "+" in key:
+            key = unquote_plus(key)
+        if key in seen or key.lower() in TRACKING_PARAMS:
+            continue
+        if "%" in value or "+" in value:
+            value = unquote_plus(value)
+        seen.add(key)
+        pairs.append((key, value))
+
+    pairs.sort()
+    return "&".join(f"{k}={v}" for k, v in pairs)
+
+
+# Bound on memoized URLs per process (on the order of 1 MB)
+_URL_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
 def normalize_url(url: str) -> str:
     """Normalize a URL for deduplication.
 
@@ -52,40 +128,50 @@ def normalize_url(url: str) -> str:
     - Removes tracking parameters
     - Removes trailing slashes (except root)
     - Sorts remaining query parameters
+
+    Results are memoized, since the same URLs recur across planning,
+    collection and dedup.
     """
-    parsed = urlparse(url)
+    scheme, netloc, path, query = _split_url(url)
 
-    # Lowercase scheme and host
-    scheme = parsed.scheme.lower()
-    netloc = parsed.netloc.lower()
+    # Lowercase host
+    netloc = netloc.lower()
 
     # Remove tracking params and sort remaining
-    query_params = parse_qs(parsed.query, keep_blank_values=True)
-    filtered_params = {
-        k: v for k, v in query_params.items() if k.lower() not in TRACKING_PARAMS
-    }
-    sorted_query = "&".join(
-        f"{k}={v[0]}" for k, v in sorted(filtered_params.items()) if v
-    )
+    sorted_query = _filter_query(query) if query else ""
 
     # Normalize path - remove trailing slash unless root
-    path = parsed.path
     if path != "/" and path.endswith("/"):
         path = path.rstrip("/")
 
-    return urlunparse((scheme, netloc, path, "", sorted_query, ""))
+    if not (scheme and netloc) or path[:1] not in ("", "/"):
+        # Relative or unusual URL - leave reassembly to urllib
+        return urlunparse((scheme, netloc, path, "", sorted_query, ""))
 
+    url = f"{scheme}://{netloc}{path}"
+    return f"{url}?{sorted_query}" if sorted_query else url
 
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
 def url_hash(url: str) -> str:
     """Generate a hash for a URL (after normalization)."""
     normalized = normalize_url(url)
     return content_hash(normalized)
 
 
+def reset_url_caches() -> None:
+    """Clear the memoized normalize_url and url_hash results."""
+    normalize_url.cache_clear()
+    url_hash.cache_clear()
+
+
+# Characters slugify drops, and the runs it collapses to a single hyphen
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_DASH_RE = re.compile(r"[-\s]+")
+
+
 def slugify(text: str) -> str:
     """Convert text to a URL-safe slug."""
     # Lowercase and replace spaces/special chars with hyphens
-    text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "-", text)
-    return text.strip("-")
+    text = _SLUG_STRIP_RE.sub("", text.lower().strip())
+    return _SLUG_DASH_RE.sub("-", text).strip("-")
@@ -1,8 +1,14 @@
 """Evidence layer: raw snapshot storage and retrieval."""
 
-from evidence.snapshot import RawSnapshot, SnapshotStore, FileSnapshotStore
+from evidence.snapshot import (
+    ContentWriter,
+    RawSnapshot,
+    SnapshotStore,
+    FileSnapshotStore,
+)
 
 __all__ = [
+    "ContentWriter",
     "RawSnapshot",
     "SnapshotStore",
     "FileSnapshotStore",
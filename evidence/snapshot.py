@@ -2,21 +2,51 @@
 
 from __future__ import annotations
 
-import json
+import os
+import secrets
+import sqlite3
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
-import uuid
 
-from pydantic import BaseModel, Field
+import orjson
+import zstandard as zstd
 
+# zstd level for stored content. Careers-page HTML compresses several-fold
+# at this level for little CPU.
+ZSTD_LEVEL = 3
 
-class RawSnapshot(BaseModel):
+
+# Paths are relative to the store's base_dir, so a store can be moved
+_INDEX_SCHEMA = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+CREATE TABLE IF NOT EXISTS snapshots (
+    snapshot_id TEXT PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    meta_path TEXT NOT NULL,
+    content_path TEXT
+);
+CREATE INDEX IF NOT EXISTS snapshots_by_run ON snapshots (run_id, fetched_at);
+"""
+
+
+def new_snapshot_id() -> str:
+    """Generate a snapshot ID."""
+    return secrets.token_hex(6)
+
+
+@dataclass(slots=True, kw_only=True)
+class RawSnapshot:
     """A raw snapshot of fetched content - the evidence layer."""
 
     # Identity
-    snapshot_id: str = Field(default_factory=lambda: uuid.uuid4().hex[:12])
+    snapshot_id: str = field(default_factory=new_snapshot_id)
     run_id: str
 
     # Source info
@@ -44,10 +74,49 @@ class RawSnapshot(BaseModel):
     error: str | None = None
 
     # Raw headers (for debugging)
-    headers: dict[str, str] = Field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
 
     # Storage reference (set after save)
     content_path: str | None = None
+    content_compression: str | None = None  # "zstd" or None (raw)
+
+    def to_json(self) -> bytes:
+        """Serialize to indented JSON bytes."""
+        return orjson.dumps(self, option=orjson.OPT_INDENT_2)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RawSnapshot:
+        """Load from a dict parsed from to_json() output."""
+        return cls(
+            **{**data, "fetched_at": datetime.fromisoformat(data["fetched_at"])}
+        )
+
+
+class ContentWriter(ABC):
+    """Incremental writer for a snapshot's raw content."""
+
+    # Compression applied to the stored bytes, if any
+    compression: str | None = None
+
+    @abstractmethod
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk of content."""
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Discard everything written so far and start over."""
+        pass
+
+    @abstractmethod
+    def commit(self) -> str:
+        """Finish writing and publish the content. Returns the content path."""
+        pass
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Discard everything written so far."""
+        pass
 
 
 class SnapshotStore(ABC):
@@ -58,6 +127,21 @@ class SnapshotStore(ABC):
         """Save a snapshot and its content. Returns updated snapshot with content_path."""
         pass
 
+    @abstractmethod
+    def open_content(self, run_id: str, snapshot_id: str) -> ContentWriter:
+        """Open a writer to stream a snapshot's content into the store."""
+        pass
+
+    @abstractmethod
+    def save_metadata(self, snapshot: RawSnapshot) -> RawSnapshot:
+        """Save snapshot metadata only (content written via open_content)."""
+        pass
+
+    # Intentionally optional: unbuffered stores have nothing to flush
+    def flush(self) -> None:  # noqa: B027
+        """Write out any buffered metadata. No-op for unbuffered stores."""
+        pass
+
     @abstractmethod
     def get_metadata(self, snapshot_id: str) -> RawSnapshot | None:
         """Get snapshot metadata by ID."""
@@ -74,19 +158,119 @@ class SnapshotStore(ABC):
         pass
 
 
+class _FileContentWriter(ContentWriter):
+    """Writes to a temp file and renames it into place on commit.
+
+    Readers never see a partially written content file. If ``compress``
+    is set, content is zstd-compressed as it is written.
+    """
+
+    def __init__(self, path: Path, compress: bool = False):
+        self.path = path
+        self._tmp_path = path.with_name(f"{path.name}.tmp")
+        # Stays open across write() calls; closed by commit() or abort()
+        self._file = open(self._tmp_path, "wb")  # noqa: SIM115
+
+        # One compressor per writer: concurrent fetches interleave their
+        # writes, and a zstd context can't be shared between open streams
+        self._compressor: zstd.ZstdCompressionObj | None = None
+        if compress:
+            self._compressor = zstd.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+            self.compression = "zstd"
+
+    def reset(self) -> None:
+        self._file.seek(0)
+        self._file.truncate()
+        if self._compressor is not None:
+            self._compressor = zstd.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def write(self, chunk: bytes) -> None:
+        if self._compressor is not None:
+            chunk = self._compressor.compress(chunk)
+        self._file.write(chunk)
+
+    def commit(self) -> str:
+        try:
+            if self._compressor is not None:
+                self._file.write(self._compressor.flush())
+            self._file.close()
+            os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
+        return str(self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
 class FileSnapshotStore(SnapshotStore):
     """File-based snapshot storage.
 
     Structure:
         base_dir/
+            index.sqlite                   (snapshot_id -> file lookup index)
             {run_id}/
-                {snapshot_id}.meta.json  (metadata)
-                {snapshot_id}.content    (raw content)
+                {snapshot_id}.meta.json    (metadata)
+                {snapshot_id}.content.zst  (zstd-compressed content)
+                {snapshot_id}.content      (raw content, if compress=False)
+
+    Metadata writes are buffered and written out in batches of
+    ``batch_size``, or on ``flush()``. Reads flush first, so they always
+    see every saved snapshot. The store is thread-safe, so the collector
+    can run its writes in worker threads.
+
+    Lookups go through a SQLite index of metadata and content paths,
+    updated on flush. Snapshots missing from the index (e.g. written
+    before it existed) are still found by scanning the run directories.
+    The last ``meta_cache_size`` parsed metadata files are cached until
+    their mtime changes, so repeated reads of a run skip decoding; treat
+    returned snapshots as read-only.
     """
 
-    def __init__(self, base_dir: str | Path):
+    def __init__(
+        self,
+        base_dir: str | Path,
+        batch_size: int = 64,
+        compress: bool = True,
+        meta_cache_size: int = 4096,
+    ):
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.compress = compress
+        self._pending: list[RawSnapshot] = []
+        self._pending_lock = threading.Lock()
+
+        # Shared across worker threads; every use holds _index_lock
+        self._index = sqlite3.connect(
+            self.base_dir / "index.sqlite",
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._index_lock = threading.Lock()
+        self._index.executescript(_INDEX_SCHEMA)
+
+        # Recently parsed metadata by file, with the mtime it was parsed at,
+        # least recently used first
+        self.meta_cache_size = meta_cache_size
+        self._meta_cache: OrderedDict[Path, tuple[int, RawSnapshot]] = OrderedDict()
+        self._meta_cache_lock = threading.Lock()
+
+    def __enter__(self) -> FileSnapshotStore:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Write out buffered metadata and close the index connection."""
+        try:
+            self.flush()
+        finally:
+            with self._index_lock:
+                self._index.close()
 
     def _run_dir(self, run_id: str) -> Path:
         path = self.base_dir / run_id
@@ -97,57 +281,203 @@ class FileSnapshotStore(SnapshotStore):
         return self._run_dir(run_id) / f"{snapshot_id}.meta.json"
 
     def _content_path(self, run_id: str, snapshot_id: str) -> Path:
-        return self._run_dir(run_id) / f"{snapshot_id}.content"
+        suffix = ".content.zst" if self.compress else ".content"
+        return self._run_dir(run_id) / f"{snapshot_id}{suffix}"
+
+    def _relative(self, path: str | Path) -> str:
+        """Path as stored in the index: relative to base_dir when inside it."""
+        path = Path(path)
+        try:
+            return path.relative_to(self.base_dir).as_posix()
+        except ValueError:
+            return str(path.absolute())
+
+    def _index_rows(
+        self, sql: str, params: tuple[Any, ...]
+    ) -> list[tuple[Any, ...]]:
+        with self._index_lock:
+            return self._index.execute(sql, params).fetchall()
+
+    def _read_meta(self, path: Path) -> RawSnapshot:
+        """Parse a metadata file, reusing the last parse if it is unchanged."""
+        mtime_ns = path.stat().st_mtime_ns
+        with self._meta_cache_lock:
+            cached = self._meta_cache.get(path)
+            if cached is not None and cached[0] == mtime_ns:
+                self._meta_cache.move_to_end(path)
+                return cached[1]
+
+        snapshot = RawSnapshot.from_dict(orjson.loads(path.read_bytes()))
+        with self._meta_cache_lock:
+            self._meta_cache[path] = (mtime_ns, snapshot)
+            self._meta_cache.move_to_end(path)
+            while len(self._meta_cache) > self.meta_cache_size:
+                self._meta_cache.popitem(last=False)
+        return snapshot
+
+    @staticmethod
+    def _read_content(path: Path) -> bytes:
+        data = path.read_bytes()
+        if path.suffix == ".zst":
+            return zstd.ZstdDecompressor().decompressobj().decompress(data)
+        return data
 
     def save(self, snapshot: RawSnapshot, content: bytes) -> RawSnapshot:
         """Save snapshot metadata and content to files."""
-        # Save content
-        content_path = self._content_path(snapshot.run_id, snapshot.snapshot_id)
-        content_path.write_bytes(content)
+        writer = self.open_content(snapshot.run_id, snapshot.snapshot_id)
+        try:
+            writer.write(content)
+        except BaseException:
+            writer.abort()
+            raise
 
         # Update snapshot with content path
-        snapshot.content_path = str(content_path)
+        snapshot.content_path = writer.commit()
+        snapshot.content_compression = writer.compression
+
+        self.save_metadata(snapshot)
+        self.flush()
+        return snapshot
 
-        # Save metadata
-        meta_path = self._meta_path(snapshot.run_id, snapshot.snapshot_id)
-        with open(meta_path, "w") as f:
-            json.dump(snapshot.model_dump(mode="json"), f, indent=2, default=str)
+    def open_content(self, run_id: str, snapshot_id: str) -> ContentWriter:
+        """Open a writer for the snapshot's content file."""
+        return _FileContentWriter(
+            self._content_path(run_id, snapshot_id), compress=self.compress
+        )
+
+    def save_metadata(self, snapshot: RawSnapshot) -> RawSnapshot:
+        """Queue snapshot metadata to be written to its JSON file."""
+        with self._pending_lock:
+            self._pending.append(snapshot)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.flush()
 
         return snapshot
 
+    def flush(self) -> None:
+        """Write all buffered metadata files."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        rows = []
+        try:
+            for snapshot in pending:
+                meta_path = self._meta_path(snapshot.run_id, snapshot.snapshot_id)
+                row = (
+                    snapshot.snapshot_id,
+                    snapshot.run_id,
+                    snapshot.fetched_at.isoformat(),
+                    self._relative(meta_path),
+                    self._relative(snapshot.content_path)
+                    if snapshot.content_path
+                    else None,
+                )
+                meta_path.write_bytes(snapshot.to_json())
+                rows.append(row)
+        finally:
+            # Requeue whatever wasn't written, ahead of newer snapshots
+            if len(rows) < len(pending):
+                with self._pending_lock:
+                    self._pending[:0] = pending[len(rows) :]
+
+            if rows:
+                with self._index_lock, self._index:
+                    self._index.execute("BEGIN")
+                    self._index.executemany(
+                        "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+
     def get_metadata(self, snapshot_id: str) -> RawSnapshot | None:
-        """Get snapshot metadata - searches all runs."""
+        """Get snapshot metadata, via the index or by searching all runs."""
+        self.flush()
+        rows = self._index_rows(
+            "SELECT meta_path FROM snapshots WHERE snapshot_id = ?",
+            (snapshot_id,),
+        )
+        if rows:
+            meta_path = self.base_dir / rows[0][0]
+            if meta_path.exists():
+                return self._read_meta(meta_path)
+
         for run_dir in self.base_dir.iterdir():
             if run_dir.is_dir():
                 meta_path = run_dir / f"{snapshot_id}.meta.json"
                 if meta_path.exists():
-                    with open(meta_path) as f:
-                        return RawSnapshot(**json.load(f))
+                    return self._read_meta(meta_path)
         return None
 
     def get_content(self, snapshot_id: str) -> bytes | None:
-        """Get raw content - searches all runs."""
+        """Get raw content, via the index or by searching all runs."""
+        self.flush()
+        rows = self._index_rows(
+            "SELECT content_path FROM snapshots WHERE snapshot_id = ?",
+            (snapshot_id,),
+        )
+        if rows and rows[0][0]:
+            content_path = self.base_dir / rows[0][0]
+            if content_path.exists():
+                return self._read_content(content_path)
+
         for run_dir in self.base_dir.iterdir():
             if run_dir.is_dir():
-                content_path = run_dir / f"{snapshot_id}.content"
-                if content_path.exists():
-                    return content_path.read_bytes()
+                for suffix in (".content.zst", ".content"):
+                    content_path = run_dir / f"{snapshot_id}{suffix}"
+                    if content_path.exists():
+                        return self._read_content(content_path)
         return None
 
-    def list_by_run(self, run_id: str) -> list[RawSnapshot]:
-        """List all snapshots for a run."""
-        run_dir = self._run_dir(run_id)
-        snapshots = []
-
-        for meta_file in run_dir.glob("*.meta.json"):
-            with open(meta_file) as f:
-                snapshots.append(RawSnapshot(**json.load(f)))
+    def _meta_paths(self, run_id: str) -> tuple[list[Path], bool]:
+        """Metadata files for a run, and whether they are oldest first.
+
+        The index gives the order, but the run directory is the source of
+        truth: index rows for removed files are dropped, and if there are
+        files the index doesn't know about, every file is returned
+        unordered.
+        """
+        self.flush()
+        rows = self._index_rows(
+            "SELECT meta_path FROM snapshots WHERE run_id = ? ORDER BY fetched_at",
+            (run_id,),
+        )
+
+        with os.scandir(self._run_dir(run_id)) as entries:
+            on_disk = {
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".meta.json")
+                and entry.is_file(follow_symlinks=False)
+            }
+
+        indexed = [self.base_dir / path for (path,) in rows]
+        paths = [path for path in indexed if path in on_disk]
+        if len(paths) < len(indexed):
+            # Files removed behind the store's back; drop their index rows
+            gone = [path for path in indexed if path not in on_disk]
+            with self._index_lock:
+                self._index.executemany(
+                    "DELETE FROM snapshots WHERE meta_path = ?",
+                    [(self._relative(path),) for path in gone],
+                )
+
+        if len(paths) == len(on_disk):
+            return paths, True
+        return list(on_disk), False
 
+    def list_by_run(self, run_id: str) -> list[RawSnapshot]:
+        """List all snapshots for a run, oldest first."""
+        paths, ordered = self._meta_paths(run_id)
+        snapshots = [self._read_meta(path) for path in paths]
+        if ordered:
+            return snapshots
         return sorted(snapshots, key=lambda s: s.fetched_at)
 
     def get_content_by_path(self, content_path: str) -> bytes | None:
         """Get content directly by path."""
         path = Path(content_path)
         if path.exists():
-            return path.read_bytes()
+            return self._read_content(path)
         return None
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +14,16 @@ from collectors.collector import collect
 from evidence.snapshot import RawSnapshot, FileSnapshotStore
 
 
+@lru_cache(maxsize=8)
+def _get_snapshot_store(path: str, compress: bool) -> FileSnapshotStore:
+    """Get the shared snapshot store for a directory.
+
+    Reusing one store across runs and result lookups keeps its index
+    connection and metadata cache warm.
+    """
+    return FileSnapshotStore(path, compress=compress)
+
+
 async def run_checkpoint_a_async(
     settings: Settings | None = None,
     sources: SourcesConfig | None = None,
@@ -41,6 +52,7 @@ async def run_checkpoint_a_async(
         settings, sources = load_config(sources_path)
 
     ctx = RunContext.boot(settings, sources, run_id)
+    failed = False
 
     try:
         # Stage 1: Plan sources
@@ -51,18 +63,29 @@ async def run_checkpoint_a_async(
             return ctx
 
         # Stage 2: Collect snapshots
-        store = FileSnapshotStore(settings.snapshots_dir)
+        store = _get_snapshot_store(
+            str(settings.snapshots_dir), settings.compress_snapshots
+        )
         snapshots = await collect(tasks, ctx, store)
 
         ctx.complete_run(RunStatus.COMPLETED)
 
     except Exception as e:
+        failed = True
         ctx.complete_run(RunStatus.FAILED)
         # Add error to the current stage if any
         if ctx.stage_logs:
             ctx.stage_logs[-1].errors.append(str(e))
         raise
 
+    finally:
+        try:
+            await ctx.aclose()
+        except Exception:
+            # Don't let a cleanup error replace the run's own error
+            if not failed:
+                raise
+
     return ctx
 
 
@@ -84,7 +107,9 @@ def get_checkpoint_a_results(ctx: RunContext) -> dict[str, Any]:
     Useful for inspection and debugging.
     """
     settings = ctx.settings
-    store = FileSnapshotStore(settings.snapshots_dir)
+    store = _get_snapshot_store(
+        str(settings.snapshots_dir), settings.compress_snapshots
+    )
     snapshots = store.list_by_run(ctx.run_id)
 
     return {